@@ -1,79 +1,267 @@
 #!/usr/bin/env python3
 """
-Aggregate extracted JSON into a pandas DataFrame.
+Aggregate extracted JSON into a flat table (pyarrow; pandas via aggregate_to_dataframe).
 
 Each row = one property from one composition from one paper.
 Paper and composition metadata are included as columns.
 
+For tables that are re-read by repeated analysis passes, prefer Feather/Arrow IPC
+output (.feather / .arrow): it is the in-memory Arrow layout on disk, so
+pyarrow.feather.read_table / pandas.read_feather load it without re-parsing cells.
+
 Usage:
   python aggregate_extracted.py extracted.json -o extracted.csv
   python aggregate_extracted.py extracted.json -o extracted.parquet
+  python aggregate_extracted.py extracted.json -o extracted.feather
   python aggregate_extracted.py extracted.json  # print to stdout
 """
 
 import argparse
 import json
 import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+# Optional: ijson streams papers one at a time instead of loading the whole file.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional: orjson parses the whole file much faster than json when ijson is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _first_token(f) -> bytes:
+    """Return the first non-whitespace byte of a binary file and rewind it."""
+    first = b""
+    while True:
+        chunk = f.read(4096)
+        if not chunk:
+            break
+        stripped = chunk.lstrip()
+        if stripped:
+            first = stripped[:1]
+            break
+    f.seek(0)
+    return first
+
+
+def _loads(raw: bytes):
+    """Parse JSON bytes with orjson if installed; json handles NaN/Infinity, which orjson rejects."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def load_extracted(path: Path) -> Iterator[dict]:
+    """
+    Yield paper results from extracted JSON (a list of papers or a single paper).
+    Streams with ijson when installed so only one paper is held in memory;
+    otherwise loads the file at once with orjson (or json).
+    """
+    with open(path, "rb") as f:
+        skip = 0
+        if ijson is not None:
+            prefix = "item" if _first_token(f) == b"[" else ""
+            try:
+                for paper in ijson.items(f, prefix, use_float=True):
+                    yield paper
+                    skip += 1
+                return
+            except ijson.JSONError:
+                # ijson rejects NaN/Infinity, which json.dump writes by default:
+                # reload with json and continue after the papers already yielded
+                f.seek(0)
+        data = _loads(f.read())
+    papers = data if isinstance(data, list) else [data]
+    yield from papers[skip:]
 
 
-def load_extracted(path: Path) -> list[dict]:
-    """Load extracted JSON (list of paper results)."""
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
-    if not isinstance(data, list):
-        data = [data]
-    return data
+def _as_str(value) -> str | None:
+    """Coerce a JSON value to a string cell (dicts/lists as JSON)."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
 
 
-def aggregate_to_dataframe(data: list[dict]) -> pd.DataFrame:
+def _float_converter(name: str):
+    """
+    Return the float cell converter for column `name` (None if not numeric or NaN).
+    The first non-numeric value dropped from the column is reported on stderr.
+    """
+    warned = False
+
+    def as_float(value) -> float | None:
+        nonlocal warned
+        if value is None:
+            return None
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            if not warned:
+                warned = True
+                print(f"Warning: dropping non-numeric {name} values (first: {value!r})", file=sys.stderr)
+            return None
+        return None if value != value else value
+
+    return as_float
+
+
+# Dictionary-encoded string type for columns with few distinct values repeated across rows
+DICT_STRING = pa.dictionary(pa.int32(), pa.string())
+
+# Output columns, grouped by the level of the nested JSON they are read from
+PAPER_COLUMNS = [
+    ("doi", DICT_STRING),
+    ("title", pa.string()),
+    ("source_file", pa.string()),
+    ("subfield", DICT_STRING),
+    ("time_spent_seconds", pa.float64()),
+]
+COMPOSITION_COLUMNS = [
+    ("composition", pa.string()),
+    ("composition_standard", pa.string()),
+    ("composition_abbreviations_resolved", pa.string()),
+    ("processing_conditions", pa.string()),
+]
+PROPERTY_COLUMNS = [
+    ("property_name", DICT_STRING),
+    ("property_symbol", DICT_STRING),
+    ("property_name_original", pa.string()),
+    ("value", pa.string()),
+    ("value_numeric", pa.float64()),
+    ("value_numeric_si", pa.float64()),
+    ("unit", DICT_STRING),
+    ("unit_si", DICT_STRING),
+    ("value_type", DICT_STRING),
+    ("value_error", pa.float64()),
+    ("measurement_condition", pa.string()),
+    ("additional_information", pa.string()),
+    ("confidence", pa.float64()),
+]
+SCHEMA = pa.schema(PAPER_COLUMNS + COMPOSITION_COLUMNS + PROPERTY_COLUMNS)
+
+
+class _DictionaryColumn:
+    """Accumulates a string column as int32 indices into a list of distinct values."""
+
+    def __init__(self):
+        self.index: dict[str, int] = {}
+        self.values: list[str] = []
+
+    def encode(self, value) -> int | None:
+        value = _as_str(value)
+        if value is None:
+            return None
+        idx = self.index.get(value)
+        if idx is None:
+            idx = self.index[value] = len(self.values)
+            self.values.append(value)
+        return idx
+
+    def to_array(self, indices: list[int | None]) -> pa.DictionaryArray:
+        return pa.DictionaryArray.from_arrays(
+            pa.array(indices, type=pa.int32()), pa.array(self.values, type=pa.string())
+        )
+
+
+def _with_converters(
+    columns: list[tuple[str, pa.DataType]],
+    dict_cols: dict[str, _DictionaryColumn],
+) -> list[tuple[str, object]]:
+    """Pair each column name with the cell converter for its type."""
+    converters = []
+    for name, t in columns:
+        if pa.types.is_dictionary(t):
+            converters.append((name, dict_cols[name].encode))
+        else:
+            converters.append((name, _float_converter(name) if pa.types.is_floating(t) else _as_str))
+    return converters
+
+
+def aggregate_to_table(data: Iterable[dict]) -> pa.Table:
     """
     Flatten nested structure: one row per property.
-    Columns: paper metadata + composition + property fields.
+    Columns: paper metadata + composition + property fields (see SCHEMA).
+    Values are appended to one list per column and converted to Arrow once;
+    repeated string columns (DICT_STRING) are stored as dictionary indices.
     """
-    rows = []
+    dict_cols = {f.name: _DictionaryColumn() for f in SCHEMA if pa.types.is_dictionary(f.type)}
+    paper_cols = _with_converters(PAPER_COLUMNS, dict_cols)
+    comp_cols = _with_converters(COMPOSITION_COLUMNS, dict_cols)
+    prop_cols = _with_converters(PROPERTY_COLUMNS, dict_cols)
+    cols: dict[str, list] = {name: [] for name in SCHEMA.names}
+
     for paper in data:
-        paper_meta = {
-            "doi": paper.get("doi"),
-            "title": paper.get("title"),
-            "source_file": paper.get("source_file"),
-            "subfield": paper.get("subfield"),
-            "time_spent_seconds": paper.get("time_spent_seconds"),
-        }
-        for comp in paper.get("compositions", []):
-            comp_meta = {
-                "composition": comp.get("composition"),
-                "composition_standard": comp.get("composition_standard"),
-                "composition_abbreviations_resolved": comp.get("composition_abbreviations_resolved"),
-                "processing_conditions": comp.get("processing_conditions"),
-            }
-            for prop in comp.get("properties_of_composition", []):
-                row = {
-                    **paper_meta,
-                    **comp_meta,
-                    "property_name": prop.get("property_name"),
-                    "property_symbol": prop.get("property_symbol"),
-                    "property_name_original": prop.get("property_name_original"),
-                    "value": prop.get("value"),
-                    "value_numeric": prop.get("value_numeric"),
-                    "value_numeric_si": prop.get("value_numeric_si"),
-                    "unit": prop.get("unit"),
-                    "unit_si": prop.get("unit_si"),
-                    "value_type": prop.get("value_type"),
-                    "value_error": prop.get("value_error"),
-                    "measurement_condition": prop.get("measurement_condition"),
-                    "additional_information": prop.get("additional_information"),
-                    "confidence": prop.get("confidence"),
-                }
-                rows.append(row)
-    return pd.DataFrame(rows)
+        paper_vals = [(cols[name], conv(paper.get(name))) for name, conv in paper_cols]
+        for comp in paper.get("compositions") or []:
+            comp_vals = [(cols[name], conv(comp.get(name))) for name, conv in comp_cols]
+            for prop in comp.get("properties_of_composition") or []:
+                for col, v in paper_vals:
+                    col.append(v)
+                for col, v in comp_vals:
+                    col.append(v)
+                for name, conv in prop_cols:
+                    cols[name].append(conv(prop.get(name)))
+
+    arrays = [
+        dict_cols[f.name].to_array(cols[f.name]) if f.name in dict_cols
+        else pa.array(cols[f.name], type=f.type)
+        for f in SCHEMA
+    ]
+    return pa.Table.from_arrays(arrays, schema=SCHEMA)
+
+
+# Parquet writer settings: zstd plus dictionary encoding for repeated string columns
+PARQUET_DICTIONARY_COLUMNS = [
+    "doi", "subfield", "property_name", "property_symbol", "unit", "unit_si", "value_type",
+]
+PARQUET_ROW_GROUP_SIZE = 50_000
+
+
+def write_parquet(table: pa.Table, path: Path, row_group_size: int = PARQUET_ROW_GROUP_SIZE) -> None:
+    """Write table to Parquet with zstd compression and dictionary-encoded string columns."""
+    pq.write_table(
+        table,
+        path,
+        compression="zstd",
+        compression_level=3,
+        use_dictionary=PARQUET_DICTIONARY_COLUMNS,
+        row_group_size=row_group_size,
+        data_page_size=1 << 20,
+    )
+
+
+def write_arrow_ipc(table: pa.Table, path: Path) -> None:
+    """Write table as an uncompressed Arrow IPC file (memory-mappable)."""
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def aggregate_to_dataframe(data: Iterable[dict]) -> pd.DataFrame:
+    """Same as aggregate_to_table, returned as a pandas DataFrame (DICT_STRING columns as categoricals)."""
+    return aggregate_to_table(data).to_pandas()
 
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Aggregate extracted JSON into a pandas DataFrame"
+        description="Aggregate extracted JSON into a flat table (CSV/Parquet/Feather/Arrow)"
     )
     parser.add_argument(
         "input",
@@ -85,12 +273,19 @@ def main():
     parser.add_argument(
         "-o", "--output",
         type=Path,
-        help="Output file (CSV or Parquet). If omitted, print to stdout.",
+        help="Output file (CSV, Parquet, Feather or Arrow IPC). If omitted, print to stdout.",
     )
     parser.add_argument(
         "--format",
-        choices=["csv", "parquet"],
-        help="Output format (inferred from -o extension if not set)",
+        choices=["csv", "parquet", "feather", "arrow"],
+        help="Output format (inferred from -o extension if not set). "
+        "feather/arrow is recommended for repeated analytics passes.",
+    )
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=PARQUET_ROW_GROUP_SIZE,
+        help=f"Rows per Parquet row group (default: {PARQUET_ROW_GROUP_SIZE})",
     )
     args = parser.parse_args()
 
@@ -98,19 +293,23 @@ def main():
         print(f"Error: {args.input} not found", file=sys.stderr)
         sys.exit(1)
 
-    data = load_extracted(args.input)
-    df = aggregate_to_dataframe(data)
+    table = aggregate_to_table(load_extracted(args.input))
 
     if args.output:
         fmt = args.format or args.output.suffix.lstrip(".").lower()
         args.output.parent.mkdir(parents=True, exist_ok=True)
         if fmt == "parquet":
-            df.to_parquet(args.output, index=False)
+            write_parquet(table, args.output, row_group_size=args.row_group_size)
+        elif fmt == "feather":
+            feather.write_feather(table, args.output, compression="zstd")
+        elif fmt in ("arrow", "ipc"):
+            write_arrow_ipc(table, args.output)
         else:
-            df.to_csv(args.output, index=False, encoding="utf-8")
-        print(f"Wrote {len(df)} rows to {args.output}", file=sys.stderr)
+            pa_csv.write_csv(table, args.output)
+        print(f"Wrote {table.num_rows} rows to {args.output}", file=sys.stderr)
     else:
-        print(df.to_csv(index=False))
+        sys.stdout.flush()
+        pa_csv.write_csv(table, sys.stdout.buffer)
 
 
 if __name__ == "__main__":
@@ -9,6 +9,7 @@ Provides:
 All functions gracefully degrade when chemdataextractor2 is not installed.
 """
 
+from collections import defaultdict
 from pathlib import Path
 from typing import Any
 
@@ -68,6 +69,40 @@ def extract_tables_cde2(html_path: str | Path) -> list[dict]:
     return tables_out
 
 
+# CDE2 record class name -> (property_name, property_symbol) for rule-based extraction
+_RULEBASED_PROPERTIES = {
+    "GlassTransition": ("glass transition temperature", "Tg"),
+    "MeltingPoint": ("melting temperature", "Tm"),
+}
+
+
+def _extract_temp_record(rec: dict, prop_name: str, prop_sym: str) -> dict:
+    """Convert a serialized CDE2 temperature record (GlassTransition, MeltingPoint) to a property dict."""
+    val = rec.get("value")
+    if val and isinstance(val, list):
+        v = val[0] if val else None
+    else:
+        v = val
+    unit = rec.get("units")
+    if isinstance(unit, dict):
+        unit = str(unit) if unit else None
+    compound = ""
+    if "compound" in rec and isinstance(rec["compound"], dict):
+        c = rec["compound"].get("Compound", {})
+        names = c.get("names", []) or c.get("labels", [])
+        compound = names[0] if names else ""
+    return {
+        "property_name": prop_name,
+        "property_symbol": prop_sym,
+        "value": str(v) if v is not None else None,
+        "value_numeric": float(v) if v is not None else None,
+        "unit": unit,
+        "value_error": rec.get("error"),
+        "compound": compound,
+        "source": "cde2_rulebased",
+    }
+
+
 def extract_properties_rulebased(html_path: str | Path) -> list[dict]:
     """
     Rule-based extraction of Tg, Tm, and other polymer properties via CDE2.
@@ -88,57 +123,14 @@ def extract_properties_rulebased(html_path: str | Path) -> list[dict]:
 
     props = []
     for record in doc.records:
-        rec_dict = record.serialize() if hasattr(record, "serialize") else {}
-        if "GlassTransition" in rec_dict:
-            gt = rec_dict["GlassTransition"]
-            val = gt.get("value")
-            if val and isinstance(val, list):
-                v = val[0] if val else None
-            else:
-                v = val
-            unit = gt.get("units")
-            if isinstance(unit, dict):
-                unit = str(unit) if unit else None
-            compound = ""
-            if "compound" in gt and isinstance(gt["compound"], dict):
-                c = gt["compound"].get("Compound", {})
-                names = c.get("names", []) or c.get("labels", [])
-                compound = names[0] if names else ""
-            props.append({
-                "property_name": "glass transition temperature",
-                "property_symbol": "Tg",
-                "value": str(v) if v is not None else None,
-                "value_numeric": float(v) if v is not None else None,
-                "unit": unit,
-                "value_error": gt.get("error"),
-                "compound": compound,
-                "source": "cde2_rulebased",
-            })
-        elif "MeltingPoint" in rec_dict:
-            mp = rec_dict["MeltingPoint"]
-            val = mp.get("value")
-            if val and isinstance(val, list):
-                v = val[0] if val else None
-            else:
-                v = val
-            unit = mp.get("units")
-            if isinstance(unit, dict):
-                unit = str(unit) if unit else None
-            compound = ""
-            if "compound" in mp and isinstance(mp["compound"], dict):
-                c = mp["compound"].get("Compound", {})
-                names = c.get("names", []) or c.get("labels", [])
-                compound = names[0] if names else ""
-            props.append({
-                "property_name": "melting temperature",
-                "property_symbol": "Tm",
-                "value": str(v) if v is not None else None,
-                "value_numeric": float(v) if v is not None else None,
-                "unit": unit,
-                "value_error": mp.get("error"),
-                "compound": compound,
-                "source": "cde2_rulebased",
-            })
+        # Check the record type before serialize(), which walks the whole record tree
+        key = type(record).__name__
+        if key not in _RULEBASED_PROPERTIES:
+            continue
+        rec_dict = record.serialize()
+        if key in rec_dict:
+            prop_name, prop_sym = _RULEBASED_PROPERTIES[key]
+            props.append(_extract_temp_record(rec_dict[key], prop_name, prop_sym))
     return props
 
 
@@ -152,33 +144,45 @@ def merge_uncertainty_and_rulebased(
     Also add any CDE2-only properties not found by LLM.
     """
     result = list(llm_props)
-    used_cde2 = set()
+    comp_lower = (composition or "").lower()
+
+    # Normalize CDE2 fields once and index candidates by name and symbol
+    cde2_norm = [
+        (
+            (cp.get("property_name") or "").lower(),
+            (cp.get("property_symbol") or "").strip(),
+            (cp.get("compound") or "").strip().lower(),
+        )
+        for cp in cde2_props
+    ]
+    by_name: dict[str, list[int]] = defaultdict(list)
+    by_sym: dict[str, list[int]] = defaultdict(list)
+    for i, (cname, csym, ccomp) in enumerate(cde2_norm):
+        if not ccomp or ccomp in comp_lower or comp_lower in ccomp:
+            by_name[cname].append(i)
+            by_sym[csym].append(i)
+    used_cde2 = bytearray(len(cde2_props))
 
     for lp in result:
         pname = (lp.get("property_name") or "").lower()
         psym = (lp.get("property_symbol") or "").strip()
-        # Try to find matching CDE2 prop
-        for i, cp in enumerate(cde2_props):
-            if i in used_cde2:
-                continue
-            cname = (cp.get("property_name") or "").lower()
-            csym = (cp.get("property_symbol") or "").strip()
-            ccomp = (cp.get("compound") or "").strip().lower()
-            comp_lower = (composition or "").lower()
-            if (cname in pname or pname in cname or psym == csym) and (
-                not ccomp or ccomp in comp_lower or comp_lower in ccomp
-            ):
-                if cp.get("value_error") is not None and lp.get("value_error") is None:
-                    lp["value_error"] = cp["value_error"]
-                used_cde2.add(i)
-                break
+        # Candidate lists are in CDE2 order; take the earliest unused match across them
+        candidates = [by_sym.get(psym, [])]
+        candidates += [idxs for cname, idxs in by_name.items() if cname in pname or pname in cname]
+        first_unused = (next((i for i in idxs if not used_cde2[i]), None) for idxs in candidates)
+        match = min((i for i in first_unused if i is not None), default=None)
+        if match is not None:
+            cp = cde2_props[match]
+            if cp.get("value_error") is not None and lp.get("value_error") is None:
+                lp["value_error"] = cp["value_error"]
+            used_cde2[match] = 1
 
     # Append CDE2-only properties (ensure schema compatibility)
     for i, cp in enumerate(cde2_props):
-        if i in used_cde2:
+        if used_cde2[i]:
             continue
-        ccomp = (cp.get("compound") or "").strip()
-        if not ccomp or ccomp.lower() in (composition or "").lower():
+        ccomp = cde2_norm[i][2]
+        if not ccomp or ccomp in comp_lower:
             prop = {**cp, "source": "cde2_rulebased"}
             prop.setdefault("value_type", "exact" if prop.get("value_numeric") is not None else "missing")
             prop.setdefault("measurement_condition", None)
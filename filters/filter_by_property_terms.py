@@ -13,15 +13,49 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
+import os
 import re
 import shutil
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
 
 from config import PROJECT_ROOT
 from parsers.rsc_html_parser import RSCSectionParser
 
+# Optional: pyahocorasick finds all polymer/property terms in one pass per sentence.
+# Falls back to the compiled term regexes if not installed.
+_AHOCORASICK_AVAILABLE = False
+try:
+    import ahocorasick
+
+    _AHOCORASICK_AVAILABLE = True
+except ImportError:
+    pass
+
+# Optional: orjson loads the synonyms JSON faster than the stdlib json module.
+_ORJSON_AVAILABLE = False
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    pass
+
+# Optional: pyarrow enables the Feather cache of parsed paper text (--cache-dir).
+_PYARROW_AVAILABLE = False
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    _PYARROW_AVAILABLE = True
+except ImportError:
+    pass
+
 POLYMER_SYNONYMS_PATH = PROJECT_ROOT / "extraction" / "polymer_synonyms.json"
 
 # Regex for property + numeric value (Tg 45 °C, Mw 50 kDa, glass transition 105 °C, etc.)
@@ -30,53 +64,73 @@ NUM_UNIT = re.compile(
 )
 # Also match numbers without units (e.g. "Tg of 105")
 NUM_ONLY = re.compile(r"\b\d+(\.\d+)?\b")
+_DIGIT_RE = re.compile(r"\d")
 
 
-def _load_polymer_synonyms(path: Path | None = None) -> dict:
-    """Load polymer_synonyms.json. Returns dict of category -> {canonical: [synonyms]}."""
-    path = path or POLYMER_SYNONYMS_PATH
-    if not path.exists():
-        return {}
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
-    return {k: v for k, v in data.items() if isinstance(v, dict) and k.startswith("_")}
+# Normalized synonyms: (lowercased term -> canonical, canonical -> all terms in its group)
+SynonymIndex = tuple[dict[str, str], dict[str, frozenset[str]]]
 
 
-def _build_property_search_terms(
-    requested: list[str],
-    synonyms_data: dict,
-) -> set[str]:
+def _load_polymer_synonyms(path: Path | None = None) -> SynonymIndex:
     """
-    Expand requested property terms using synonyms.
-    Returns set of all terms to search for (canonical + synonyms).
+    Load polymer_synonyms.json and normalize it once.
+
+    Synonym groups live under underscore-prefixed category keys
+    ("_THERMAL_PROPERTIES": {canonical: [synonyms]}); other top-level keys such as
+    "comment" are not categories and are skipped.
+    Returns (term_to_canonical, canonical_to_group); both empty if the file is missing.
     """
+    path = path or POLYMER_SYNONYMS_PATH
+    if not path.exists():
+        return {}, {}
+    raw = path.read_bytes()
+    data = None
+    if _ORJSON_AVAILABLE:
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity, which json accepts
+    if data is None:
+        data = json.loads(raw)
+
     # Flatten: collect all {canonical: [synonyms]} from all categories
     all_mappings: dict[str, list[str]] = {}
-    for category, mappings in synonyms_data.items():
-        if isinstance(mappings, dict):
+    for category, mappings in data.items():
+        if isinstance(mappings, dict) and category.startswith("_"):
             for canonical, syn_list in mappings.items():
                 if isinstance(syn_list, list):
                     all_mappings[canonical] = [s for s in syn_list if isinstance(s, str)]
 
     # Build reverse: term -> canonical (first match wins to avoid Tg->TGA overwriting Tg->glass transition)
     term_to_canonical: dict[str, str] = {}
+    canonical_to_group: dict[str, frozenset[str]] = {}
     for canonical, syns in all_mappings.items():
-        if canonical.lower() not in term_to_canonical:
-            term_to_canonical[canonical.lower()] = canonical
+        term_to_canonical.setdefault(canonical.lower(), canonical)
         for s in syns:
-            sl = s.lower()
-            if sl not in term_to_canonical:
-                term_to_canonical[sl] = canonical
+            term_to_canonical.setdefault(s.lower(), canonical)
+        canonical_to_group[canonical] = frozenset([canonical, *syns])
+    return term_to_canonical, canonical_to_group
+
+
+def _build_property_search_terms(
+    requested: list[str],
+    synonyms: SynonymIndex,
+) -> set[str]:
+    """
+    Expand requested property terms using synonyms from _load_polymer_synonyms.
+    Returns set of all terms to search for (canonical + synonyms).
+    """
+    term_to_canonical, canonical_to_group = synonyms
 
     # For each requested term, find its canonical and collect all terms in that group
     search_terms: set[str] = set()
-    requested_lower = [r.strip().lower() for r in requested if r.strip()]
-
-    for req in requested_lower:
+    for req in requested:
+        req = req.strip().lower()
+        if not req:
+            continue
         canonical = term_to_canonical.get(req)
         if canonical:
-            group = {canonical} | set(all_mappings.get(canonical, []))
-            search_terms.update(group)
+            search_terms |= canonical_to_group[canonical]
         else:
             # Term not in synonyms - add as-is for exact match
             search_terms.add(req)
@@ -84,27 +138,36 @@ def _build_property_search_terms(
     return search_terms
 
 
-def _split_into_sentences(text: str) -> list[str]:
-    """Simple sentence splitter."""
+# Sentence boundary in whitespace-collapsed text: ". " / "! " / "? " before a capital
+_SENT_RE = re.compile(r"(?<=[.!?]) (?=[A-Z])")
+
+
+def _split_into_sentences(text: str, normalized: bool = False) -> list[str]:
+    """Simple sentence splitter. Pass normalized=True if whitespace is already collapsed."""
     if not text:
         return []
-    text = re.sub(r"\s+", " ", text)
-    parts = re.split(r"(?<=[.!?])\s+(?=[A-Z])", text)
-    return [p.strip() for p in parts if len(p.strip()) > 15]
+    # str.split() collapses and trims whitespace in one C pass, so parts need no strip()
+    if not normalized:
+        text = " ".join(text.split())
+    return [p for p in _SENT_RE.split(text) if len(p) > 15]
 
 
-def _regex_poly_patterns(sentence: str) -> list[str]:
-    """Find polymer mentions via regex."""
-    hits = []
-    for m in re.finditer(r"\bpoly\s*\(\s*([^)]+)\)", sentence, re.I):
-        hits.append(f"poly({m.group(1).strip()})")
-    for m in re.finditer(
-        r"\b(poly(?:vinyl|styrene|ethylene|propylene|ester|amide|ether|urethane|imide|saccharide))\b",
-        sentence,
-        re.I,
-    ):
-        hits.append(m.group(1))
-    return hits
+_POLY_PAREN = re.compile(r"\bpoly\s*\(\s*([^)]+)\)", re.I)
+_POLY_COMPOUND = re.compile(
+    r"\b(poly(?:vinyl|styrene|ethylene|propylene|ester|amide|ether|urethane|imide|saccharide))\b",
+    re.I,
+)
+
+
+def _compile_terms_regex(terms) -> re.Pattern:
+    """
+    Compile one case-insensitive whole-word alternation for all terms.
+    Longest terms come first so ambiguous prefixes resolve to the longer term.
+    """
+    escaped = [re.escape(t) for t in sorted({t.lower() for t in terms if t}, key=len, reverse=True)]
+    if not escaped:
+        return re.compile(r"(?!)")
+    return re.compile(r"\b(?:" + "|".join(escaped) + r")\b", re.I)
 
 
 # Polymer lexicon for triple detection
@@ -112,71 +175,290 @@ POLYMER_TERMS = {
     "polymer", "polymers", "macromolecule", "macromolecules", "copolymer",
     "copolymers", "homopolymer", "homopolymers", "oligomer", "oligomers",
 }
+_POLYMER_RE = _compile_terms_regex(POLYMER_TERMS)
+
+
+# Term kinds stored in the Aho-Corasick automaton (bit flags; a term can be both)
+_POLYMER_TERM = 1
+_PROPERTY_TERM = 2
+_ALL_TERM_KINDS = _POLYMER_TERM | _PROPERTY_TERM
+
+
+def _build_term_automaton(property_terms):
+    """
+    Build an Aho-Corasick automaton over lowercased POLYMER_TERMS and property terms.
+    Each word maps to (length, kind flags). Returns None if pyahocorasick is not installed.
+    """
+    if not _AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kind, terms in ((_POLYMER_TERM, POLYMER_TERMS), (_PROPERTY_TERM, property_terms)):
+        for term in terms:
+            term = term.lower()
+            if term:
+                _, flags = automaton.get(term, (0, 0))
+                automaton.add_word(term, (len(term), flags | kind))
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
 
+def _at_word_boundary(text: str, i: int) -> bool:
+    """True where regex \\b would match at position i of text."""
+    before = i > 0 and _is_word_char(text[i - 1])
+    after = i < len(text) and _is_word_char(text[i])
+    return before != after
 
-def _find_whole_word(sentence: str, terms: set[str]) -> list[str]:
-    """Find whole-word mentions of terms in sentence (case-insensitive)."""
-    s_lower = sentence.lower()
-    hits = []
-    for term in terms:
-        pattern = r"\b" + re.escape(term.lower()) + r"\b"
-        if re.search(pattern, s_lower):
-            hits.append(term)
-    return hits
+
+def _automaton_term_kinds(text_lower: str, automaton) -> int:
+    """
+    Return the kind flags of whole-word term hits in text_lower.
+    Stops as soon as both kinds have been seen; boundaries are only checked for new kinds.
+    """
+    found = 0
+    for end, (length, kind) in automaton.iter(text_lower):
+        if kind & ~found and (
+            _at_word_boundary(text_lower, end - length + 1) and _at_word_boundary(text_lower, end + 1)
+        ):
+            found |= kind
+            if found == _ALL_TERM_KINDS:
+                break
+    return found
 
 
 def _has_valid_triple(
     sentence: str,
-    property_terms: set[str],
+    property_re: re.Pattern,
+    automaton=None,
 ) -> bool:
     """
     Check if sentence contains (polymer, property, value) triple.
     - Polymer mention (poly(X), polymer, copolymer, etc.)
-    - Property term (or synonym)
+    - Property term (or synonym), matched by property_re from _compile_terms_regex
+      or, when given, by the automaton from _build_term_automaton
     - Numeric value (with optional unit)
+    Checks run cheapest first; with the automaton, polymer and property terms
+    are found in a single pass over the sentence.
     """
-    polys = _find_whole_word(sentence, POLYMER_TERMS) + _regex_poly_patterns(sentence)
-    if not polys:
+    # No digit means no value: skips the term matching for most sentences
+    if not _DIGIT_RE.search(sentence):
         return False
 
-    props = _find_whole_word(sentence, property_terms)
-    if not props:
+    if automaton is not None:
+        found = _automaton_term_kinds(sentence.lower(), automaton)
+        if not found & _PROPERTY_TERM:
+            return False
+        has_poly = bool(found & _POLYMER_TERM)
+    else:
+        has_poly = bool(_POLYMER_RE.search(sentence))
+
+    # poly(X) / polyX regexes only when no polymer word was found
+    if not (has_poly or _POLY_PAREN.search(sentence) or _POLY_COMPOUND.search(sentence)):
         return False
 
-    has_num = bool(NUM_UNIT.search(sentence)) or bool(NUM_ONLY.search(sentence))
-    if not has_num:
+    if automaton is None and not property_re.search(sentence):
         return False
 
-    return True
+    # NUM_ONLY covers most values, NUM_UNIT adds numbers glued to units (e.g. "45K")
+    return bool(NUM_ONLY.search(sentence) or NUM_UNIT.search(sentence))
 
 
 def _build_full_text(meta: dict, sections: dict, tables: list) -> str:
     """Build full paper text from title, all sections, and tables."""
     parts = [meta.get("title", "")]
-    for section_name, section_text in sections.items():
-        if section_text and section_text.strip():
+    # isspace() tests for blank text without allocating a stripped copy; the matcher
+    # collapses whitespace later, so parts are joined as-is.
+    for section_text in sections.values():
+        if section_text and not section_text.isspace():
             parts.append(section_text)
     for t in tables:
-        content = t.get("content", "").strip()
-        if content:
+        content = t.get("content")
+        if content and not content.isspace():
             parts.append(content)
     return " ".join(parts)
 
 
 def is_paper_with_property_triples(
     full_text: str,
-    property_terms: set[str],
+    property_terms: set[str] | re.Pattern,
+    automaton=None,
 ) -> tuple[bool, str]:
     """
     Determine if paper contains at least one (polymer, property, value) triple
     where property matches one of the requested terms or synonyms.
+    property_terms may be pre-compiled with _compile_terms_regex, and automaton
+    built with _build_term_automaton, to reuse them across papers.
     """
-    for sent in _split_into_sentences(full_text):
-        if _has_valid_triple(sent, property_terms):
+    if not isinstance(property_terms, re.Pattern):
+        if automaton is None:
+            automaton = _build_term_automaton(property_terms)
+        property_terms = _compile_terms_regex(property_terms)
+
+    text = " ".join(full_text.split())
+    # Whole-text pre-check: a paper without any property term or polymer mention
+    # cannot contain a triple, so skip the per-sentence work entirely.
+    if automaton is not None:
+        found = _automaton_term_kinds(text.lower(), automaton)
+        has_prop = bool(found & _PROPERTY_TERM)
+        has_poly = bool(found & _POLYMER_TERM)
+    else:
+        has_prop = bool(property_terms.search(text))
+        has_poly = None
+    if not has_prop:
+        return False, "no property term present"
+    if has_poly is None:
+        has_poly = bool(_POLYMER_RE.search(text))
+    if not (has_poly or _POLY_PAREN.search(text) or _POLY_COMPOUND.search(text)):
+        return False, "no polymer mention present"
+
+    for sent in _split_into_sentences(text, normalized=True):
+        if _has_valid_triple(sent, property_terms, automaton):
             return True, f"found (polymer, property, value) triple"
     return False, "no matching (polymer, property, value) triples"
 
 
+def _cache_path(cache_dir: Path, path: Path) -> Path:
+    """
+    Cache file for a paper: one directory per resolved path (hashed, so equal names
+    in different corpora do not collide), one file per mtime/size so edits invalidate it.
+    """
+    st = path.stat()
+    key = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()
+    return cache_dir / key / f"{st.st_mtime_ns}-{st.st_size}.feather"
+
+
+def _write_cached_text(cached: Path, full_text: str) -> None:
+    """Write a one-row Feather cache entry and drop stale entries for the same paper."""
+    table = pa.table({"full_text": pa.array([full_text], type=pa.large_string())})
+    tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+    try:
+        cached.parent.mkdir(exist_ok=True)
+        feather.write_feather(table, tmp, compression="zstd")
+        os.replace(tmp, cached)
+        for old in cached.parent.iterdir():
+            if old.suffix == ".feather" and old != cached:
+                old.unlink(missing_ok=True)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def _load_full_text(path: Path, cache_dir: Path | None = None) -> str:
+    """
+    Parse a paper and return its full text (title, sections, tables).
+    With cache_dir, the text is read from / written to a Feather sidecar instead of re-parsing.
+    """
+    cached = _cache_path(cache_dir, path) if cache_dir is not None else None
+    if cached is not None and cached.exists():
+        try:
+            return feather.read_table(cached, columns=["full_text"]).column(0)[0].as_py()
+        except Exception:
+            pass  # Unreadable cache entry: re-parse and overwrite
+
+    parser = RSCSectionParser(path, include_tables=True)
+    result = parser.to_dict()
+    meta = result.get("meta", {})
+    sections = result.get("sections", {})
+    tables = result.get("tables", [])
+    full_text = _build_full_text(meta, sections, tables)
+
+    if cached is not None:
+        _write_cached_text(cached, full_text)
+    return full_text
+
+
+# Settings for _process_one, initialised once per worker process by _init_worker
+_worker_property_re: re.Pattern | None = None
+_worker_automaton = None
+_worker_cache_dir: Path | None = None
+
+
+def _init_worker(search_terms: frozenset[str], cache_dir: Path | None = None) -> None:
+    """Build the term regex/automaton once in this process for _process_one."""
+    global _worker_property_re, _worker_automaton, _worker_cache_dir
+    _worker_property_re = _compile_terms_regex(search_terms)
+    _worker_automaton = _build_term_automaton(search_terms)
+    _worker_cache_dir = cache_dir
+
+
+def _process_one(path: Path) -> tuple[Path, bool, str]:
+    """Parse one paper and test it for triples. Returns (path, passed, reason)."""
+    try:
+        full_text = _load_full_text(path, _worker_cache_dir)
+    except Exception as e:
+        return path, False, f"parse error: {e}"
+
+    ok, reason = is_paper_with_property_triples(full_text, _worker_property_re, _worker_automaton)
+    return path, ok, reason
+
+
+def _iter_html_files(folder: Path, sort: bool = False) -> Iterator[Path]:
+    """Yield HTML files in folder lazily via os.scandir, or sorted by name if sort=True."""
+    if sort:
+        yield from sorted(_iter_html_files(folder))
+        return
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.name.endswith(".html") and entry.is_file():
+                yield Path(entry.path)
+
+
+LINK_MODES = ("copy", "hardlink", "reflink")
+_FICLONE = 0x40049409  # Linux ioctl: share the source file's extents (Btrfs, XFS)
+
+
+def _reflink(src: Path, dst: Path) -> None:
+    """Clone src to a new file dst without copying data blocks. Raises OSError if unsupported."""
+    import fcntl
+
+    with open(src, "rb") as fsrc, open(dst, "xb") as fdst:
+        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    shutil.copystat(src, dst)
+
+
+def _place_file(src: Path, dst: Path, link_mode: str = "copy") -> None:
+    """
+    Put src at dst as a hardlink, reflink or copy. Hardlink/reflink fall back to
+    shutil.copy2 when unsupported (other filesystem, no permission, no reflink support).
+    The file is created under a temporary name and moved onto dst, so dst is never
+    truncated or removed in place; if dst already is src (same inode), nothing is done.
+    """
+    if dst.exists() and os.path.samefile(src, dst):
+        return
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+    tmp.unlink(missing_ok=True)  # Leftover from an interrupted run; never src itself
+    try:
+        placed = False
+        if link_mode == "hardlink":
+            try:
+                os.link(src, tmp)
+                placed = True
+            except OSError:
+                pass
+        elif link_mode == "reflink":
+            try:
+                _reflink(src, tmp)
+                placed = True
+            except (ImportError, OSError):
+                tmp.unlink(missing_ok=True)
+        if not placed:
+            shutil.copy2(src, tmp)
+        os.replace(tmp, dst)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _open_list_file(path: Path | None, stack: ExitStack):
+    """Open an output list file for writing (creating parent dirs), or return None."""
+    if not path:
+        return None
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return stack.enter_context(open(path, "w", encoding="utf-8"))
+
+
 def filter_papers(
     folder: Path,
     property_terms: list[str],
@@ -185,10 +467,21 @@ def filter_papers(
     failures_file: Path | None = None,
     copy_to: Path | None = None,
     verbose: bool = True,
+    workers: int | None = None,
+    cache_dir: Path | None = None,
+    sort: bool = False,
+    link_mode: str = "copy",
 ) -> list[Path]:
-    """Filter papers that contain (polymer, property, value) triples for requested properties."""
-    synonyms_data = _load_polymer_synonyms(synonyms_path)
-    search_terms = _build_property_search_terms(property_terms, synonyms_data)
+    """
+    Filter papers that contain (polymer, property, value) triples for requested properties.
+    Papers are processed in `workers` processes (default: CPU count; 1 = in-process),
+    in directory order unless sort=True (name order, deterministic output).
+    link_mode controls how copy_to is populated: "copy", "hardlink" or "reflink".
+    With cache_dir (requires pyarrow), parsed paper text is cached as Feather files
+    so reruns with different properties skip HTML parsing.
+    """
+    synonyms = _load_polymer_synonyms(synonyms_path)
+    search_terms = _build_property_search_terms(property_terms, synonyms)
 
     if not search_terms:
         search_terms = {t.lower() for t in property_terms if t.strip()}
@@ -196,68 +489,69 @@ def filter_papers(
     if verbose:
         print(f"Property search terms ({len(search_terms)}): {sorted(search_terms)[:15]}...", file=sys.stderr)
 
-    html_files = sorted(folder.glob("*.html"))
-    if not html_files:
-        print(f"No HTML files found in {folder}", file=sys.stderr)
-        if output_file:
-            Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-            Path(output_file).write_text("", encoding="utf-8")
-        return []
-
-    passing = []
-    failing = []
-
-    for i, path in enumerate(html_files):
-        if verbose and (i + 1) % 50 == 0:
-            print(f"  Processed {i + 1}/{len(html_files)}...", file=sys.stderr)
-
-        try:
-            parser = RSCSectionParser(path, include_tables=True)
-            result = parser.to_dict()
-        except Exception as e:
-            if verbose:
-                print(f"  Error parsing {path.name}: {e}", file=sys.stderr)
-            failing.append((path, f"parse error: {e}"))
-            continue
+    html_files = _iter_html_files(folder, sort=sort)
+    total = sum(1 for _ in _iter_html_files(folder)) if verbose else None
 
-        meta = result.get("meta", {})
-        sections = result.get("sections", {})
-        tables = result.get("tables", [])
-        full_text = _build_full_text(meta, sections, tables)
+    if cache_dir is not None:
+        if _PYARROW_AVAILABLE:
+            cache_dir = Path(cache_dir)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        else:
+            print("pyarrow not installed; ignoring --cache-dir", file=sys.stderr)
+            cache_dir = None
 
-        ok, reason = is_paper_with_property_triples(full_text, search_terms)
-        if ok:
-            passing.append(path)
+    passing = []
+    n_failing = 0
+    workers = workers or os.cpu_count() or 1
+    search_terms = frozenset(search_terms)
+
+    # Passing/failing papers are written as they are decided, so the lists can be
+    # consumed before filtering finishes
+    with ExitStack() as stack:
+        out_f = _open_list_file(output_file, stack)
+        fail_f = _open_list_file(failures_file, stack)
+
+        if workers == 1:
+            _init_worker(search_terms, cache_dir)
+            results = map(_process_one, html_files)
         else:
-            failing.append((path, reason))
+            executor = stack.enter_context(ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(search_terms, cache_dir)
+            ))
+            results = executor.map(_process_one, html_files, chunksize=8)
+
+        for i, (path, ok, reason) in enumerate(results):
+            if verbose and (i + 1) % 50 == 0:
+                print(f"  Processed {i + 1}/{total}...", file=sys.stderr)
+            if ok:
+                passing.append(path)
+                if out_f:
+                    out_f.write(f"{path.name}\n")
+            else:
+                if verbose and reason.startswith("parse error"):
+                    print(f"  {path.name}: {reason}", file=sys.stderr)
+                n_failing += 1
+                if fail_f:
+                    fail_f.write(f"{path.name}\t{reason}\n")
+
+    n_files = len(passing) + n_failing
+    if not n_files:
+        print(f"No HTML files found in {folder}", file=sys.stderr)
+        return []
 
     if verbose:
-        print(f"\nPassed: {len(passing)} / {len(html_files)}", file=sys.stderr)
-        print(f"Failed: {len(failing)}", file=sys.stderr)
-
-    if output_file:
-        output_file = Path(output_file)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, "w") as f:
-            for p in passing:
-                f.write(f"{p.name}\n")
-        if verbose:
+        print(f"\nPassed: {len(passing)} / {n_files}", file=sys.stderr)
+        print(f"Failed: {n_failing}", file=sys.stderr)
+        if output_file:
             print(f"Wrote list to {output_file}", file=sys.stderr)
-
-    if failures_file:
-        failures_file = Path(failures_file)
-        failures_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(failures_file, "w") as f:
-            for p, reason in failing:
-                f.write(f"{p.name}\t{reason}\n")
-        if verbose:
+        if failures_file:
             print(f"Wrote failures to {failures_file}", file=sys.stderr)
 
     if copy_to:
         copy_to = Path(copy_to)
         copy_to.mkdir(parents=True, exist_ok=True)
         for p in passing:
-            shutil.copy2(p, copy_to / p.name)
+            _place_file(p, copy_to / p.name, link_mode)
         if verbose:
             print(f"Copied to {copy_to}", file=sys.stderr)
 
@@ -287,6 +581,13 @@ def main():
         "--copy-to",
         help="Copy passing papers to this directory",
     )
+    parser.add_argument(
+        "--link-mode",
+        choices=LINK_MODES,
+        default="copy",
+        help="How --copy-to places files: copy (default), hardlink or reflink; "
+        "links fall back to copying when unsupported",
+    )
     parser.add_argument(
         "--properties",
         nargs="+",
@@ -304,6 +605,23 @@ def main():
         default=POLYMER_SYNONYMS_PATH,
         help=f"Path to polymer synonyms JSON (default: {POLYMER_SYNONYMS_PATH.name})",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Cache parsed paper text here (Feather, needs pyarrow) to skip HTML parsing on reruns",
+    )
+    parser.add_argument(
+        "--sort",
+        action="store_true",
+        help="Process papers in file name order (deterministic output order)",
+    )
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count; 1 = no multiprocessing)",
+    )
     parser.add_argument(
         "-q", "--quiet",
         action="store_true",
@@ -336,6 +654,10 @@ def main():
         failures_file=args.failures,
         copy_to=args.copy_to,
         verbose=not args.quiet,
+        workers=args.workers,
+        cache_dir=args.cache_dir,
+        sort=args.sort,
+        link_mode=args.link_mode,
     )
 
     if not args.quiet: